@@ -7,13 +7,27 @@ A hidden test endpoint '/_results' renders a basic HTML table of rows.
 
 from __future__ import annotations
 
+import atexit
 import csv
+import gzip
+import hashlib
+import hmac
+import io
 import os
-from datetime import datetime
-from typing import List, Dict, Tuple
-
-from flask import Flask, redirect, render_template, request, url_for
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, List, Dict, Sequence, Tuple
+
+from flask import (
+    Flask, Response, abort, redirect, render_template, request,
+    stream_template, stream_with_context, url_for,
+)
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, func, inspect, lambda_stmt, select, text
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from flask_wtf import FlaskForm
 from wtforms import StringField, SelectField, DateField, TimeField, DecimalField
@@ -32,12 +46,49 @@ CSV_HEADERS = [
     "timestamp", "guest_name", "baby_name", "gender",
     "due_date", "due_time", "weight_kg"
 ]
+# The submitted values that identify a guess (everything but the timestamp).
+GUESS_FIELDS = CSV_HEADERS[1:]
 SHOW_RESULTS = os.getenv("SHOW_RESULTS", "false").lower() == "true"
 RESULTS_PASSWORD = os.getenv("RESULTS_PASSWORD", "")
 
 DB_PATH = "sqlite:///app.db"
 db = SQLAlchemy()  # create globally, but init later inside the app factory
 
+# Applied to every new SQLite connection: WAL lets /results read while guesses
+# are being committed, and NORMAL sync drops one fsync per transaction.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Buffered CSV rows are flushed every CSV_FLUSH_INTERVAL seconds, or sooner
+# once CSV_FLUSH_BATCH rows are waiting.
+CSV_FLUSH_INTERVAL = 0.05
+CSV_FLUSH_BATCH = 64
+
+_csv_fd: int | None = None
+_csv_ready = False
+# Guess inserts are committed in batches of up to GUESS_BATCH_SIZE rows,
+# waiting at most GUESS_BATCH_WAIT seconds for a batch to fill.
+GUESS_BATCH_SIZE = 128
+GUESS_BATCH_WAIT = 0.05
+
+_pending_rows: Deque[bytes] = deque()
+_pending_lock = threading.Lock()
+# Serialises disk writes so appends never wait on write()/fsync().
+_write_lock = threading.Lock()
+_flush_wakeup = threading.Event()
+_CSV_QUOTE = str.maketrans({'"': '""'})
+_EPOCH = datetime(1970, 1, 1)
+# Stored in place of a legacy timestamp that could not be parsed; shown as
+# "unknown" rather than as a made-up date.
+UNKNOWN_TIMESTAMP = -1
+# Spreadsheets evaluate cells starting with these as formulas.
+_FORMULA_PREFIXES = ("=", "+", "-", "@")
 
 
 # -----------------------------------------------------------------------------
@@ -46,11 +97,56 @@ db = SQLAlchemy()  # create globally, but init later inside the app factory
 
 def ensure_csv_exists() -> None:
     """Create the data directory and CSV file with headers if missing."""
+    global _csv_ready
+    if _csv_ready:
+        return
     os.makedirs(DATA_DIR, exist_ok=True)
     if not os.path.exists(CSV_PATH):
         with open(CSV_PATH, "w", newline="", encoding="utf-8") as header_file:
             header_writer = csv.writer(header_file)
             header_writer.writerow(CSV_HEADERS)
+    _csv_ready = True
+
+
+def open_csv_writer() -> None:
+    """Open the CSV once for appending and start the background flusher."""
+    global _csv_fd
+    with _pending_lock:
+        if _csv_fd is not None:
+            return
+        ensure_csv_exists()
+        _csv_fd = os.open(CSV_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    threading.Thread(target=_flush_loop, name="csv-flusher", daemon=True).start()
+    atexit.register(flush_guesses)
+
+
+def flush_guesses() -> None:
+    """Write any buffered rows to disk in one write and fsync the CSV file."""
+    with _write_lock:
+        with _pending_lock:
+            if _csv_fd is None or not _pending_rows:
+                return
+            payload = memoryview(b"".join(_pending_rows))
+            _pending_rows.clear()
+        while payload:
+            written = os.write(_csv_fd, payload)
+            payload = payload[written:]
+        os.fsync(_csv_fd)
+
+
+def _flush_loop() -> None:
+    """Background loop draining the row buffer on a short timer."""
+    while True:
+        _flush_wakeup.wait(CSV_FLUSH_INTERVAL)
+        _flush_wakeup.clear()
+        flush_guesses()
+
+
+def _fast_csv_row(fields: Tuple[str, ...]) -> bytes:
+    """Format one fully-quoted CSV line as UTF-8 bytes."""
+    return (
+        ",".join('"' + field.translate(_CSV_QUOTE) + '"' for field in fields) + "\r\n"
+    ).encode("utf-8")
 
 
 def append_guess(
@@ -61,82 +157,349 @@ def append_guess(
     due_time: str,
     weight_kg: str,
 ) -> None:
-    """Append a single guess row to the CSV file."""
+    """Queue a single guess row for the background CSV writer."""
+    if _csv_fd is None:
+        open_csv_writer()
     timestamp = datetime.utcnow().isoformat()
-    with open(CSV_PATH, "a", newline="", encoding="utf-8") as append_file:
-        append_writer = csv.writer(append_file)
-        append_writer.writerow(
-            [timestamp, guest_name, baby_name, gender, due_date, due_time, weight_kg]
+    row = _fast_csv_row(
+        (timestamp, guest_name, baby_name, gender, due_date, due_time, weight_kg)
+        )
+    with _pending_lock:
+        _pending_rows.append(row)
+        backlog = len(_pending_rows)
+    if backlog >= CSV_FLUSH_BATCH:
+        _flush_wakeup.set()
+
+
+def read_guesses(
+    columns: Sequence[str] | None = None,
+) -> Tuple[List[Dict[str, str | None]], List[str]]:
+    """Read all guesses from CSV and return (rows, headers).
+
+    Pass ``columns`` to keep only those fields; the others are never copied
+    out of the parsed lines. Like ``csv.DictReader``, blank lines are skipped
+    and fields missing from a short line come back as ``None``.
+    """
+    if not _csv_ready:
+        ensure_csv_exists()
+    flush_guesses()
+    with open(CSV_PATH, newline="", encoding="utf-8") as csv_file:
+        csv_reader = csv.reader(csv_file)
+        file_headers = next(csv_reader, None) or CSV_HEADERS
+        headers = list(columns) if columns else file_headers
+        unknown = [h for h in headers if h not in file_headers]
+        if unknown:
+            raise ValueError(f"Unknown CSV column(s): {', '.join(unknown)}")
+        positions = [(h, file_headers.index(h)) for h in headers]
+        rows: List[Dict[str, str | None]] = [
+            {h: line[i] if i < len(line) else None for h, i in positions}
+            for line in csv_reader
+            if line
+        ]
+    return rows, headers
+
+
+def _guess_digest(fields: Sequence[str]) -> bytes:
+    """Return a content hash identifying a guess by its submitted values."""
+    return hashlib.sha256("\x1f".join(fields).encode("utf-8")).digest()
+
+
+def _csv_safe(value: str | None) -> str | None:
+    """Quote a guest-typed cell so spreadsheets show it as text, not a formula."""
+    if value and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Tune each new SQLite connection for a write-mostly workload."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def ns_isoformat(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value as a UTC ISO-8601 string."""
+    if timestamp_ns == UNKNOWN_TIMESTAMP:
+        return "unknown"
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    moment = datetime.fromtimestamp(seconds, timezone.utc).replace(
+        microsecond=nanos // 1000, tzinfo=None
+    )
+    return moment.isoformat()
+
+
+def _legacy_timestamp_ns(value: Any) -> int | None:
+    """Convert a timestamp stored by an older schema to time.time_ns() units.
+
+    Returns ``None`` when the value is not a timestamp at all.
+    """
+    if isinstance(value, int):
+        return value
+    text = str(value or "").strip()
+    if text.isdigit():
+        return int(text)
+    try:
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return (moment - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _migrate_guess_timestamps(table: Any, logger: Any) -> None:
+    """Rebuild a guess table whose timestamps were stored as text.
+
+    Older releases declared ``timestamp`` as an ISO string or DateTime, which
+    SQLite gives text affinity, so the column cannot simply be re-declared.
+    The table is copied into the current schema inside one transaction; this
+    is a no-op for new databases and ones already migrated. Rows whose
+    timestamp cannot be parsed are logged and kept with UNKNOWN_TIMESTAMP.
+    """
+    raw = db.engine.raw_connection()
+    sqlite_conn = raw.driver_connection
+    isolation_level = sqlite_conn.isolation_level
+    sqlite_conn.isolation_level = None  # explicit BEGIN/COMMIT keeps the DDL atomic
+    try:
+        cursor = sqlite_conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            column_types = {
+                row[1]: row[2].upper()
+                for row in cursor.execute(f"PRAGMA table_info({table.name})")
+            }
+            if column_types and column_types.get("timestamp") != "BIGINT":
+                legacy = f"{table.name}_legacy"
+                names = [column.name for column in table.columns]
+                ts = names.index("timestamp")
+                for index in table.indexes:
+                    cursor.execute(f"DROP INDEX IF EXISTS {index.name}")
+                cursor.execute(f"ALTER TABLE {table.name} RENAME TO {legacy}")
+                cursor.execute(str(CreateTable(table).compile(db.engine)))
+                for index in table.indexes:
+                    if not index.unique:  # left to _ensure_unique_guess_index
+                        cursor.execute(str(CreateIndex(index).compile(db.engine)))
+                rows = []
+                for row in cursor.execute(f"SELECT {', '.join(names)} FROM {legacy}"):
+                    timestamp_ns = _legacy_timestamp_ns(row[ts])
+                    if timestamp_ns is None:
+                        logger.warning(
+                            "Guess id %s has an unparseable timestamp %r; keeping it as unknown",
+                            row[names.index("id")],
+                            row[ts],
+                        )
+                        timestamp_ns = UNKNOWN_TIMESTAMP
+                    rows.append(row[:ts] + (timestamp_ns,) + row[ts + 1:])
+                cursor.executemany(
+                    f"INSERT INTO {table.name} ({', '.join(names)}) "
+                    f"VALUES ({', '.join('?' for _ in names)})",
+                    rows,
+                )
+                cursor.execute(f"DROP TABLE {legacy}")
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+    finally:
+        sqlite_conn.isolation_level = isolation_level
+        raw.close()
+
+
+def _ensure_unique_guess_index(table: Any, logger: Any) -> None:
+    """Add the unique submission index to a table created before it existed.
+
+    Stored rows are never removed: if the table already holds duplicate
+    submissions the index is skipped with a warning, and duplicates are then
+    only caught by the in-process digest check.
+    """
+    index = next(index for index in table.indexes if index.unique)
+    with db.engine.begin() as conn:
+        existing = {ix["name"] for ix in inspect(conn).get_indexes(table.name)}
+        if index.name in existing:
+            return
+        fields = ", ".join(column.name for column in index.columns)
+        duplicates = conn.execute(text(
+            f"SELECT COUNT(*) FROM (SELECT 1 FROM {table.name} "
+            f"GROUP BY {fields} HAVING COUNT(*) > 1)"
+        )).scalar()
+        if duplicates:
+            logger.warning(
+                "Not adding unique index %s: %d guess(es) are stored more than once",
+                index.name,
+                duplicates,
             )
+            return
+        conn.execute(CreateIndex(index, if_not_exists=True))
 
 
-def read_guesses() -> Tuple[List[Dict[str, str]], List[str]]:
-    """Read all guesses from CSV and return (rows, headers)."""
-    if not os.path.exists(CSV_PATH):
-        return [], CSV_HEADERS
-    with open(CSV_PATH, newline="", encoding="utf-8") as csv_file:
-        dict_reader = csv.DictReader(csv_file)
-        rows: List[Dict[str, str]] = list(dict_reader)
-        headers = dict_reader.fieldnames or CSV_HEADERS
-    return rows, headers
+def _guess_writer(
+    app: Flask,
+    model: Any,
+    pending: "queue.Queue[Dict[str, Any]]",
+    seen: set[bytes],
+    seen_lock: threading.Lock,
+) -> None:
+    """Background loop committing queued guesses with batched inserts.
+
+    Rows matching an existing guess are ignored by the unique index, and
+    digests are only recorded once their batch has committed.
+    """
+    with app.app_context():
+        while True:
+            batch = [pending.get()]
+            deadline = time.monotonic() + GUESS_BATCH_WAIT
+            while len(batch) < GUESS_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                db.session.execute(model.__table__.insert().prefix_with("OR IGNORE"), batch)
+                db.session.commit()
+                with seen_lock:
+                    seen.update(
+                        _guess_digest([row[f] for f in GUESS_FIELDS]) for row in batch
+                    )
+            except Exception:
+                db.session.rollback()
+                app.logger.exception("Failed to save %d guesses", len(batch))
+            finally:
+                for _ in batch:
+                    pending.task_done()
+
+
+# -----------------------------------------------------------------------------
+# Models (module level so several apps, e.g. in tests, can share the metadata)
+# -----------------------------------------------------------------------------
+
+class Guess(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    timestamp = db.Column(db.BigInteger, nullable=False, index=True, default=time.time_ns)
+    guest_name = db.Column(db.String(80), nullable=False)
+    baby_name = db.Column(db.String(120))
+    gender = db.Column(db.String(16))
+    due_date = db.Column(db.String(10))
+    due_time = db.Column(db.String(5))
+    weight_kg = db.Column(db.String(10))
+
+    __table_args__ = (db.Index("uq_guess_submission", *GUESS_FIELDS, unique=True),)
+
+
+# -----------------------------------------------------------------------------
+# Forms
+# -----------------------------------------------------------------------------
+
+class GuessForm(FlaskForm):
+    guest_name = StringField("Your Name", validators=[DataRequired(), Length(max=80)])
+    baby_name  = StringField("Baby Name", validators=[Optional(), Length(max=120)])
+    gender     = SelectField("Gender", choices=[("", "Not sure"), ("Boy", "Boy"), ("Girl", "Girl")])
+    due_date   = DateField("Due Date", validators=[Optional()])
+    due_time   = TimeField("Due Time", validators=[Optional()])
+    weight     = DecimalField("Birth Weight (kg)", places=2,
+                            validators=[Optional(), NumberRange(min=0, max=10)])
 
 
 # -----------------------------------------------------------------------------
 # App factory (keeps globals tidy for linters & testing)
 # -----------------------------------------------------------------------------
 
-def create_app() -> Flask:
-    """Create and configure the Flask application."""
+def create_app(test_config: Dict[str, Any] | None = None) -> Flask:
+    """Create and configure the Flask application.
+
+    ``test_config`` overrides any of the settings below, e.g. to point the
+    app at a temporary database or to lock the results page.
+    """
     app = Flask(__name__)
 
     # --- Configuration (these lines go here) ---
     app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "dev-only-change-me")
     app.config["SQLALCHEMY_DATABASE_URI"] = DB_PATH
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"pool_pre_ping": True}
+    app.config["SHOW_RESULTS"] = SHOW_RESULTS
+    app.config["RESULTS_PASSWORD"] = RESULTS_PASSWORD
+    if test_config:
+        app.config.from_mapping(test_config)
 
     # --- Initialize extensions ---
     db.init_app(app)
 
-    # --- Define your model here ---
-    class Guess(db.Model):
-        id = db.Column(db.Integer, primary_key=True)
-        timestamp = db.Column(db.String(32), nullable=False)
-        guest_name = db.Column(db.String(80), nullable=False)
-        baby_name = db.Column(db.String(120))
-        gender = db.Column(db.String(16))
-        due_date = db.Column(db.String(10))
-        due_time = db.Column(db.String(5))
-        weight_kg = db.Column(db.String(10))
-
-    class GuessForm(FlaskForm):
-        guest_name = StringField("Your Name", validators=[DataRequired(), Length(max=80)])
-        baby_name  = StringField("Baby Name", validators=[Optional(), Length(max=120)])
-        gender     = SelectField("Gender", choices=[("", "Not sure"), ("Boy", "Boy"), ("Girl", "Girl")])
-        due_date   = DateField("Due Date", validators=[Optional()])
-        due_time   = TimeField("Due Time", validators=[Optional()])
-        weight     = DecimalField("Birth Weight (kg)", places=2,
-                                validators=[Optional(), NumberRange(min=0, max=10)])
-
+    # --- Cached statements for /results (compiled once per process) ---
+    results_key_stmt = lambda_stmt(
+        lambda: select(func.coalesce(func.max(Guess.id), 0), func.count(Guess.id))
+    )
+    results_rows_stmt = lambda_stmt(
+        lambda: select(*(getattr(Guess, h) for h in CSV_HEADERS)).order_by(
+            Guess.id.asc()
+        )
+    )
+
+    # --- Per-app caches ---
+    # Rendered /results page, keyed on the (max id, row count) it was built from.
+    results_cache: Dict[str, Any] = {"key": None, "html": None, "gzip": None}
+    results_lock = threading.Lock()
+    # Digests of every guess committed by this app or loaded at startup, so
+    # repeat submissions skip the queue; the unique index, when present, is the
+    # real guard.
+    seen_guesses: set[bytes] = set()
+    seen_lock = threading.Lock()
+    app.extensions["results_cache"] = results_cache
+    app.extensions["seen_guesses"] = seen_guesses
 
     # --- Create the database file if it doesn’t exist ---
     with app.app_context():
+        event.listen(db.engine, "connect", _apply_sqlite_pragmas)
+        _migrate_guess_timestamps(Guess.__table__, app.logger)
         db.create_all()
+        _ensure_unique_guess_index(Guess.__table__, app.logger)
+        stored = db.session.execute(select(*(getattr(Guess, f) for f in GUESS_FIELDS)))
+        seen_guesses.update(
+            _guess_digest([value or "" for value in row]) for row in stored
+        )
+
+    # --- Commit guesses in batches from a background thread ---
+    pending_guesses: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+    threading.Thread(
+        target=_guess_writer,
+        args=(app, Guess, pending_guesses, seen_guesses, seen_lock),
+        name="guess-writer",
+        daemon=True,
+    ).start()
+    atexit.register(pending_guesses.join)
+    app.extensions["pending_guesses"] = pending_guesses
+
+    app.add_template_filter(ns_isoformat)
+
+    # --- Results lock (only when a password is set and results are hidden) ---
+    results_locked = bool(app.config["RESULTS_PASSWORD"]) and not app.config["SHOW_RESULTS"]
+    results_password = app.config["RESULTS_PASSWORD"].encode("utf-8")
+    locked_template = app.jinja_env.get_template("results_locked.html")
 
     @app.route("/", methods=["GET", "POST"])
     def index():
         form = GuessForm()
         if form.validate_on_submit():
-            new_guess = Guess(
-                timestamp=datetime.utcnow().isoformat(),
-                guest_name=form.guest_name.data.strip(),
-                baby_name=(form.baby_name.data or "").strip(),
-                gender=form.gender.data or "",
-                due_date=form.due_date.data.isoformat() if form.due_date.data else "",
-                due_time=form.due_time.data.strftime("%H:%M") if form.due_time.data else "",
-                weight_kg=str(form.weight.data) if form.weight.data is not None else "",
-            )
-            db.session.add(new_guess)
-            db.session.commit()
+            guess = {
+                "guest_name": form.guest_name.data.strip(),
+                "baby_name": (form.baby_name.data or "").strip(),
+                "gender": form.gender.data or "",
+                "due_date": form.due_date.data.isoformat() if form.due_date.data else "",
+                "due_time": form.due_time.data.strftime("%H:%M") if form.due_time.data else "",
+                "weight_kg": str(form.weight.data) if form.weight.data is not None else "",
+            }
+            digest = _guess_digest([guess[f] for f in GUESS_FIELDS])
+            with seen_lock:
+                is_new = digest not in seen_guesses
+            if is_new:
+                guess["timestamp"] = time.time_ns()
+                pending_guesses.put(guess)
+                with results_lock:
+                    results_cache["key"] = None
             return redirect(url_for("thanks"))
         return render_template("index.html", form=form)
 
@@ -149,10 +512,85 @@ def create_app() -> Flask:
     @app.route("/results", methods=["GET", "POST"])
     def results():
         """Results page using a template for table rendering."""
-        guesses = Guess.query.order_by(Guess.id.asc()).all()
-        headers = ["timestamp","guest_name","baby_name","gender","due_date","due_time","weight_kg"]
-        rows = [{h: getattr(g, h) for h in headers} for g in guesses]
-        return render_template("results.html", rows=rows, headers=headers)
+        if results_locked:
+            if request.method != "POST":
+                return locked_template.render(error=None)
+            password = request.form.get("password", "").encode("utf-8")
+            if not hmac.compare_digest(password, results_password):
+                return locked_template.render(error="Incorrect password."), 403
+        cache_key = tuple(db.session.execute(results_key_stmt).one())
+        etag = "%d-%d" % cache_key
+
+        def tagged(response: Response) -> Response:
+            response.set_etag(etag, weak=True)
+            response.vary.add("Accept-Encoding")
+            return response
+
+        if request.if_none_match.contains_weak(etag):
+            return tagged(Response(status=304))
+        with results_lock:
+            if results_cache["key"] == cache_key:
+                if request.accept_encodings["gzip"] > 0:
+                    response = Response(results_cache["gzip"], mimetype="text/html")
+                    response.headers["Content-Encoding"] = "gzip"
+                else:
+                    response = Response(results_cache["html"], mimetype="text/html")
+                return tagged(response)
+        headers = CSV_HEADERS
+
+        def row_dicts():
+            rows_iter = db.session.execute(
+                results_rows_stmt, execution_options={"yield_per": 500}
+            )
+            for r in rows_iter:
+                yield dict(zip(headers, r))
+
+        def stream_and_cache(stream):
+            chunks = []
+            for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+            html = "".join(chunks).encode("utf-8")
+            compressed = gzip.compress(html)
+            with results_lock:
+                results_cache["key"] = cache_key
+                results_cache["html"] = html
+                results_cache["gzip"] = compressed
+
+        stream = stream_template("results.html", rows=row_dicts(), headers=headers)
+        return tagged(Response(stream_and_cache(stream), mimetype="text/html"))
+
+    @app.route("/export.csv", methods=["GET"])
+    def export_csv():
+        """Stream every stored guess as CSV, revalidated with an ETag."""
+        if results_locked:
+            abort(403)
+        etag = "%d-%d" % tuple(db.session.execute(results_key_stmt).one())
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+
+        def csv_lines():
+            buffer = io.StringIO()
+            line_writer = csv.writer(buffer)
+            line_writer.writerow(CSV_HEADERS)
+            rows_iter = db.session.execute(
+                results_rows_stmt, execution_options={"yield_per": 500}
+            )
+            for timestamp_ns, *fields in rows_iter:
+                line_writer.writerow(
+                    [ns_isoformat(timestamp_ns), *map(_csv_safe, fields)]
+                )
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+
+        response = Response(stream_with_context(csv_lines()), mimetype="text/csv")
+        response.headers["Content-Disposition"] = "attachment; filename=guesses.csv"
+        response.set_etag(etag, weak=True)
+        return response
 
     return app
 
@@ -162,5 +600,5 @@ def create_app() -> Flask:
 # -----------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    # Running via `python app.py`
-    create_app().run(debug=True)
+    # Running via `python app.py` (development only; see wsgi.py for Gunicorn)
+    create_app().run(debug=os.getenv("FLASK_DEBUG", "").lower() in ("1", "true"))
@@ -0,0 +1,52 @@
+"""Shared fixtures: each test gets its own app backed by a temporary database."""
+
+from __future__ import annotations
+
+import pytest
+
+import app as shower
+
+
+GUESS = {"guest_name": "Ann", "baby_name": "Bo", "gender": "Boy", "weight": "3.2"}
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    def factory(**config):
+        return shower.create_app({
+            "TESTING": True,
+            "WTF_CSRF_ENABLED": False,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'app.db'}",
+            **config,
+        })
+    return factory
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def submit(app, client):
+    """Post a guess and wait until the background writer has committed it."""
+    def post(**fields):
+        response = client.post("/", data={**GUESS, **fields})
+        assert response.status_code == 302
+        app.extensions["pending_guesses"].join()
+    return post
+
+
+@pytest.fixture
+def fetch():
+    """GET a (possibly streamed) response and read it to the end."""
+    def get(client, url, **kwargs):
+        response = client.get(url, **kwargs)
+        response.get_data()
+        return response
+    return get
@@ -0,0 +1,49 @@
+"""The CSV helpers: buffered appends and column-projected reads."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import app as shower
+
+
+@pytest.fixture
+def csv_dir(tmp_path, monkeypatch):
+    """Run the CSV helpers against a fresh ./data directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(shower, "_csv_ready", False)
+    monkeypatch.setattr(shower, "_csv_fd", None)
+    yield tmp_path / "data"
+    if shower._csv_fd is not None:
+        shower.flush_guesses()
+        os.close(shower._csv_fd)
+
+
+def test_append_guess_round_trips_through_read_guesses(csv_dir):
+    shower.append_guess('Ann "A", Jr', "Bo, the 1st", "Boy", "2026-01-02", "", "3.2")
+    shower.append_guess("Cy", "", "Girl", "", "10:30", "")
+
+    rows, headers = shower.read_guesses()
+
+    assert headers == shower.CSV_HEADERS
+    assert [row["guest_name"] for row in rows] == ['Ann "A", Jr', "Cy"]
+    assert rows[0]["baby_name"] == "Bo, the 1st"
+    assert rows[0]["due_date"] == "2026-01-02"
+    assert rows[1]["due_time"] == "10:30"
+
+
+
+def test_read_guesses_projects_columns(csv_dir):
+    csv_dir.mkdir()
+    (csv_dir / "guesses.csv").write_text(
+        ",".join(shower.CSV_HEADERS) + "\r\nt,Ann,Bo,Boy,,,3\r\n\r\n", encoding="utf-8"
+    )
+
+    rows, headers = shower.read_guesses(["guest_name", "gender"])
+    assert headers == ["guest_name", "gender"]
+    assert rows == [{"guest_name": "Ann", "gender": "Boy"}]
+
+    with pytest.raises(ValueError, match="nope"):
+        shower.read_guesses(["nope"])
@@ -0,0 +1,42 @@
+"""Duplicate submissions: stored once, and never pruned from an existing table."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+
+def test_duplicate_guess_is_stored_once(app, client, submit, fetch):
+    submit()
+    submit()
+    # Forget the digests so the second copy reaches the unique index.
+    app.extensions["seen_guesses"].clear()
+    submit()
+
+    body = fetch(client, "/results").get_data(as_text=True)
+    assert body.count("<td>Ann</td>") == 1
+
+
+@pytest.mark.parametrize("timestamp_type", ["BIGINT", "VARCHAR(32)"])
+def test_existing_duplicates_survive_startup(tmp_path, make_app, caplog, timestamp_type):
+    legacy = sqlite3.connect(tmp_path / "app.db")
+    legacy.execute(
+        f"CREATE TABLE guess (id INTEGER NOT NULL, timestamp {timestamp_type} NOT NULL, "
+        "guest_name VARCHAR(80) NOT NULL, baby_name VARCHAR(120), gender VARCHAR(16), "
+        "due_date VARCHAR(10), due_time VARCHAR(5), weight_kg VARCHAR(10), PRIMARY KEY (id))"
+    )
+    legacy.executemany(
+        "INSERT INTO guess VALUES (?, 1, 'Ann', 'Bo', 'Boy', '', '', '3.2')", [(1,), (2,)]
+    )
+    legacy.commit()
+    legacy.close()
+
+    make_app()
+
+    stored = sqlite3.connect(tmp_path / "app.db")
+    assert stored.execute("SELECT id FROM guess ORDER BY id").fetchall() == [(1,), (2,)]
+    indexes = {row[1] for row in stored.execute("PRAGMA index_list(guess)")}
+    stored.close()
+    assert "uq_guess_submission" not in indexes
+    assert "stored more than once" in caplog.text
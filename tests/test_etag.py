@@ -0,0 +1,17 @@
+"""Conditional GETs against /results."""
+
+from __future__ import annotations
+
+
+def test_results_returns_304_for_matching_etag(client, submit, fetch):
+    submit()
+    etag = fetch(client, "/results").headers["ETag"]
+
+    response = fetch(client, "/results", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+
+    submit(guest_name="Cy")
+    response = fetch(client, "/results", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
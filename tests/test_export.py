@@ -0,0 +1,27 @@
+"""The /export.csv download built from the guess table."""
+
+from __future__ import annotations
+
+import app as shower
+
+
+def test_export_streams_stored_guesses(client, submit, fetch):
+    submit(guest_name='Ann "A", Jr')
+
+    response = fetch(client, "/export.csv")
+    assert response.mimetype == "text/csv"
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0] == ",".join(shower.CSV_HEADERS)
+    assert lines[1].endswith(',"Ann ""A"", Jr",Bo,Boy,,,3.2')
+
+    etag = response.headers["ETag"]
+    assert fetch(client, "/export.csv", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_export_neutralises_formula_cells(client, submit, fetch):
+    submit(guest_name="=HYPERLINK(\"http://x\")", baby_name="+1", gender="Girl")
+    submit(guest_name="@SUM(A1)", baby_name="-2", gender="Boy")
+
+    lines = fetch(client, "/export.csv").get_data(as_text=True).splitlines()
+    assert lines[1].endswith(",\"'=HYPERLINK(\"\"http://x\"\")\",'+1,Girl,,,3.2")
+    assert lines[2].endswith(",'@SUM(A1),'-2,Boy,,,3.2")
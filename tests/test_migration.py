@@ -0,0 +1,44 @@
+"""Upgrading databases written by releases that stored timestamps as text."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+
+import pytest
+
+
+def _legacy_db(path, *timestamps):
+    legacy = sqlite3.connect(path)
+    legacy.execute(
+        "CREATE TABLE guess (id INTEGER NOT NULL, timestamp VARCHAR(32) NOT NULL, "
+        "guest_name VARCHAR(80) NOT NULL, baby_name VARCHAR(120), gender VARCHAR(16), "
+        "due_date VARCHAR(10), due_time VARCHAR(5), weight_kg VARCHAR(10), PRIMARY KEY (id))"
+    )
+    legacy.executemany(
+        "INSERT INTO guess VALUES (?, ?, 'Ann', '', 'Boy', '', '', '')",
+        list(enumerate(timestamps, start=1)),
+    )
+    legacy.commit()
+    legacy.close()
+
+
+def test_legacy_text_timestamps_are_migrated(tmp_path, make_app, fetch):
+    _legacy_db(tmp_path / "app.db", "2025-10-08T12:00:00.123456")
+
+    app = make_app()
+
+    body = fetch(app.test_client(), "/results").get_data(as_text=True)
+    assert "<td>2025-10-08T12:00:00.123456</td><td>Ann</td>" in re.sub(r">\s+<", "><", body)
+
+
+@pytest.mark.parametrize("timestamp", ["garbage", ""])
+def test_unparseable_timestamps_are_kept_as_unknown(tmp_path, make_app, fetch, caplog, timestamp):
+    _legacy_db(tmp_path / "app.db", timestamp)
+
+    app = make_app()
+
+    assert "Guess id 1 has an unparseable timestamp" in caplog.text
+    body = re.sub(r">\s+<", "><", fetch(app.test_client(), "/results").get_data(as_text=True))
+    assert "<td>unknown</td><td>Ann</td>" in body
+    assert "1970" not in body
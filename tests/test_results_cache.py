@@ -0,0 +1,18 @@
+"""The cached /results page and its gzip copy."""
+
+from __future__ import annotations
+
+import gzip
+
+
+def test_cached_results_respect_gzip_quality(client, submit, fetch):
+    submit()
+    plain = fetch(client, "/results").get_data()
+
+    response = fetch(client, "/results", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.get_data()) == plain
+
+    response = fetch(client, "/results", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "Content-Encoding" not in response.headers
+    assert response.get_data() == plain
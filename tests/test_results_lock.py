@@ -0,0 +1,28 @@
+"""Password-locking /results and the CSV export."""
+
+from __future__ import annotations
+
+
+def test_locked_results_require_password(make_app, fetch):
+    app = make_app(RESULTS_PASSWORD="sekrit")
+    client = app.test_client()
+
+    response = fetch(client, "/results")
+    assert response.status_code == 200
+    assert "Results are locked" in response.get_data(as_text=True)
+
+    response = client.post("/results", data={"password": "nope"})
+    assert response.status_code == 403
+    assert "Incorrect password." in response.get_data(as_text=True)
+
+    response = client.post("/results", data={"password": "sekrit"})
+    assert "Guests' Guesses" in response.get_data(as_text=True)
+
+    assert fetch(client, "/export.csv").status_code == 403
+
+
+def test_show_results_overrides_password(make_app, fetch):
+    app = make_app(RESULTS_PASSWORD="sekrit", SHOW_RESULTS=True)
+
+    body = fetch(app.test_client(), "/results").get_data(as_text=True)
+    assert "Guests' Guesses" in body
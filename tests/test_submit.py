@@ -0,0 +1,33 @@
+"""Guesses posted to the form reach the results page via the batch writer."""
+
+from __future__ import annotations
+
+import re
+
+
+def test_submitted_guess_appears_on_results(client, submit, fetch):
+    assert "No submissions yet." in fetch(client, "/results").get_data(as_text=True)
+
+    submit()
+
+    body = fetch(client, "/results").get_data(as_text=True)
+    assert "<td>Ann</td><td>Bo</td><td>Boy</td>" in re.sub(r">\s+<", "><", body)
+    assert "No submissions yet." not in body
+
+
+def test_results_escapes_guest_input(client, submit, fetch):
+    submit(guest_name="<b>Eve</b>")
+
+    body = fetch(client, "/results").get_data(as_text=True)
+    assert "&lt;b&gt;Eve&lt;/b&gt;" in body
+    assert "<b>Eve</b>" not in body
+
+
+def test_apps_do_not_share_results_or_dedup_state(tmp_path, make_app, client, submit, fetch):
+    submit()
+    fetch(client, "/results")
+    other = make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'other.db'}")
+
+    body = fetch(other.test_client(), "/results").get_data(as_text=True)
+    assert "No submissions yet." in body
+    assert not other.extensions["seen_guesses"]
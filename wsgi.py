@@ -0,0 +1,5 @@
+"""WSGI entrypoint for production servers such as Gunicorn."""
+
+from app import create_app
+
+application = create_app()